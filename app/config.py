@@ -1,12 +1,17 @@
 """Application configuration."""
 
 import os
+from dataclasses import dataclass
 from typing import Optional
 
-from pydantic_settings import BaseSettings
+from dotenv import load_dotenv
 
+# Read .env once at import; real environment variables take precedence
+load_dotenv()
 
-class Settings(BaseSettings):
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application settings loaded from environment variables."""
 
     # Home Assistant
@@ -21,15 +26,12 @@ class Settings(BaseSettings):
     dashboard_refresh_interval: int = int(
         os.getenv("DASHBOARD_REFRESH_INTERVAL", "900")
     )  # 15 minutes (how often TRMNL polls)
+    cache_duration: int = int(
+        os.getenv("CACHE_DURATION", "300")
+    )  # 5 minutes (how long a rendered dashboard is reused)
 
     # Logging
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
 
-    class Config:
-        """Pydantic config."""
-
-        env_file = ".env"
-        case_sensitive = False
-
 
 settings = Settings()
@@ -1,16 +1,273 @@
 """Dashboard image renderer."""
 
+import asyncio
+import functools
+import hashlib
+import io
 import logging
-from datetime import datetime
+import os
+import threading
+from datetime import date, datetime
 from pathlib import Path
 from typing import Optional
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 
 from app.ha.models import Goal
 
 logger = logging.getLogger(__name__)
 
+# Day-of-period ticks that get slightly longer ticks (period edges and the midweek weekend)
+WEEKEND_TICKS = frozenset({0, 6, 7, 8, 13, 14})
+
+# Short day names indexed by datetime.weekday()
+DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# Ink values (0/255 work for both the "L" background and the "1" canvas)
+BLACK = 0
+WHITE = 255
+LIGHT_GRAY = 208  # Dithered to a light stipple by _convert_to_monochrome
+
+# Standard 8x8 Bayer matrix for ordered dithering (values 0-63)
+BAYER_8X8 = (
+    (0, 48, 12, 60, 3, 51, 15, 63),
+    (32, 16, 44, 28, 35, 19, 47, 31),
+    (8, 56, 4, 52, 11, 59, 7, 55),
+    (40, 24, 36, 20, 43, 27, 39, 23),
+    (2, 50, 14, 62, 1, 49, 13, 61),
+    (34, 18, 46, 30, 33, 17, 45, 29),
+    (10, 58, 6, 54, 9, 57, 5, 53),
+    (42, 26, 38, 22, 41, 25, 37, 21),
+)
+
+# Point LUT mapping any non-zero value to white
+_NONZERO_LUT = [0] + [255] * 255
+
+# Font paths to try - prioritize CJK-capable fonts
+FONT_PATHS = (
+    # CJK fonts (support Chinese, Japanese, Korean)
+    "/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/truetype/droid/DroidSansFallbackFull.ttf",
+    "/usr/share/fonts/truetype/wqy/wqy-zenhei.ttc",
+    "/usr/share/fonts/truetype/arphic/uming.ttc",
+    # Standard fonts (fallback)
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",  # macOS
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_font_path() -> Optional[str]:
+    """Find the first available font file, or None if none are installed."""
+    return next((path for path in FONT_PATHS if Path(path).exists()), None)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font face, shared across renderers."""
+    return ImageFont.truetype(path, size)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_fonts() -> dict:
+    """
+    Load fonts for rendering, including CJK support.
+
+    Cached so the TrueType files are opened and parsed once per process.
+    """
+    fonts = {}
+
+    path = _find_font_path()
+    if path:
+        try:
+            fonts["header"] = _load_font(path, 24)
+            fonts["title"] = _load_font(path, 20)
+            fonts["normal"] = _load_font(path, 16)
+            fonts["small"] = _load_font(path, 14)
+            logger.info(f"Loaded fonts from {path}")
+        except Exception as e:
+            logger.warning(f"Could not load TrueType fonts: {e}, using default")
+            fonts = {}
+
+    # Fall back to default fonts
+    if not fonts:
+        default_font = ImageFont.load_default()
+        fonts["header"] = default_font
+        fonts["title"] = default_font
+        fonts["normal"] = default_font
+        fonts["small"] = default_font
+
+    return fonts
+
+
+@functools.lru_cache(maxsize=256)
+def _text_mask(text: str, font_key: str) -> tuple[Image.Image, int, int]:
+    """
+    Rasterize text into a mask.
+
+    Cached so the FreeType layout and rasterization only happen the first
+    time a given (text, font) pair is drawn or measured.
+
+    Returns:
+        Tuple of (mask, x_offset, y_offset) relative to the text origin
+    """
+    font = _get_fonts()[font_key]
+    left, top, right, bottom = font.getbbox(text)
+    mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)), 0)
+
+    # Rasterize without antialiasing: the canvas is 1-bit, so partially
+    # covered pixels would otherwise be lost
+    draw = ImageDraw.Draw(mask)
+    draw.fontmode = "1"
+    draw.text((-left, -top), text, fill=255, font=font)
+    return mask, left, top
+
+
+@functools.lru_cache(maxsize=8)
+def _dash_mask(length: int, dash_length: int = 4, gap_length: int = 3) -> Image.Image:
+    """
+    Build a mask for a 2px-wide dashed vertical line of the given length.
+
+    The line is centred on x=2 of the mask. Cached so the dash loop only runs
+    once per line length rather than on every render.
+    """
+    mask = Image.new("L", (4, length + 1), 0)
+    draw = ImageDraw.Draw(mask)
+
+    for y0, y1 in _dash_segments(length, dash_length, gap_length):
+        draw.line((2, y0, 2, y1), fill=255, width=2)
+
+    return mask
+
+
+@functools.lru_cache(maxsize=8)
+def _dash_segments(length: int, dash_length: int = 4, gap_length: int = 3) -> tuple[tuple[int, int], ...]:
+    """(start, end) offsets of each dash in a dashed line of the given length."""
+    period = dash_length + gap_length
+    return tuple((y, min(y + dash_length, length)) for y in range(0, length, period))
+
+
+@functools.lru_cache(maxsize=64)
+def _segment_offsets(width: int, segments: int) -> tuple[int, ...]:
+    """X offsets of the dividers splitting a bar of the given width into equal segments."""
+    segment_width = width / segments
+    return tuple(int(i * segment_width) for i in range(1, segments))
+
+
+@functools.lru_cache(maxsize=16)
+def _row_offsets(top: int, available_height: int, num_goals: int) -> tuple[int, ...]:
+    """Y offsets of goal rows spread evenly over the available height."""
+    goal_spacing = available_height / num_goals
+    return tuple(top + int(i * goal_spacing) for i in range(num_goals))
+
+
+@functools.lru_cache(maxsize=128)
+def _progress_bar(width: int, height: int, segments: int, filled_width: int) -> tuple[Image.Image, Image.Image]:
+    """
+    Build a progress bar image and the mask of the pixels it covers.
+
+    The bar's unfilled interior is left out of the mask so anything drawn
+    behind it (the weekend band) still shows through. Bars only change when
+    a count changes, so most renders reuse a cached bar.
+
+    Args:
+        width: Bar width
+        height: Bar height
+        segments: Number of equal segments to divide the bar into (0 for none)
+        filled_width: Width of the filled portion
+
+    Returns:
+        Tuple of (bar, mask): the bar in the canvas's 1-bit mode, the mask L mode
+    """
+    bar = Image.new("L", (width + 1, height + 1), WHITE)
+    mask = Image.new("L", bar.size, 0)
+    bar_draw = ImageDraw.Draw(bar)
+    mask_draw = ImageDraw.Draw(mask)
+
+    def line(xy, fill, line_width):
+        bar_draw.line(xy, fill=fill, width=line_width)
+        mask_draw.line(xy, fill=255, width=line_width)
+
+    # Draw filled portion
+    if filled_width > 0:
+        bar_draw.rectangle((0, 0, filled_width, height), fill=BLACK)
+        mask_draw.rectangle((0, 0, filled_width, height), fill=255)
+
+    # Draw segment dividers: white on the filled portion so you can see
+    # increments, black on the unfilled portion. Drawn before the outline
+    # so the white dividers don't cut through it.
+    if segments:
+        for seg_x in _segment_offsets(width, segments):
+            if seg_x < filled_width:
+                line((seg_x, 0, seg_x, height), WHITE, 2)
+            else:
+                line((seg_x, 0, seg_x, height), BLACK, 1)
+
+    # Draw bar outline
+    bar_draw.rectangle((0, 0, width, height), outline=BLACK, width=1)
+    mask_draw.rectangle((0, 0, width, height), outline=255, width=1)
+
+    # The bar is pure black and white, so it converts to 1-bit exactly; doing it
+    # here saves a conversion on every paste onto the 1-bit canvas
+    return bar.convert("1", dither=Image.Dither.NONE), mask
+
+
+@functools.lru_cache(maxsize=4)
+def _period_text(period_start: date, period_end: date) -> str:
+    """Format the header's period range (only changes once per period)."""
+    return f"{period_start.strftime('%b %d')} - {period_end.strftime('%b %d, %Y')}"
+
+
+@functools.lru_cache(maxsize=8)
+def _day_ticks_mask(bar_width: int) -> Image.Image:
+    """
+    Build a mask with ticks for all 14 days across a bar of the given width.
+
+    The mask's origin is 2px left of the bar's left edge and at the top of the ticks.
+    """
+    mask = Image.new("L", (bar_width + 4, 8), 0)
+    draw = ImageDraw.Draw(mask)
+
+    # Draw ticks for all 14 days (bolder)
+    for day in range(15):  # 0 through 14
+        tick_x = 2 + min(int((day / 14) * bar_width), bar_width)
+        tick_bottom = 5 + (2 if day in WEEKEND_TICKS else 0)
+        draw.line((tick_x, 0, tick_x, tick_bottom), fill=255, width=2)
+
+    return mask
+
+
+def _encode_png(image: Image.Image) -> bytes:
+    """
+    Encode a monochrome image as PNG in memory, favouring speed over size.
+
+    Mode "1" images are written at 1 bit per pixel, and with compress_level=1
+    deflate effort is minimal: the dashboard is tiny, mostly flat and
+    regenerated on every poll, so a smaller file buys nothing.
+    """
+    if image.mode != "1":
+        image = image.convert("1")
+
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG", optimize=False, compress_level=1)
+    return buffer.getvalue()
+
+
+@functools.lru_cache(maxsize=2)
+def _bayer_threshold(size: tuple[int, int]) -> Image.Image:
+    """Build a threshold map of the given size by tiling the Bayer matrix (scaled to 0-252)."""
+    cell = Image.new("L", (8, 8))
+    cell.putdata([value * 4 for row in BAYER_8X8 for value in row])
+
+    threshold = Image.new("L", size)
+    for y in range(0, size[1], 8):
+        for x in range(0, size[0], 8):
+            threshold.paste(cell, (x, y))
+    return threshold
+
 
 class DashboardRenderer:
     """Renders habit tracker dashboard to image."""
@@ -20,6 +277,7 @@ class DashboardRenderer:
     HEADER_HEIGHT = 62
     BOTTOM_MARGIN = 20
     BAR_HEIGHT = 20  # Taller bars
+    BAR_OFFSET = 22  # Distance from the top of a goal row to its bar
 
     def __init__(self, output_dir: str = "static/images"):
         """
@@ -31,53 +289,27 @@ class DashboardRenderer:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Try to load fonts, fall back to default
-        self.fonts = self._load_fonts()
-
-    def _load_fonts(self) -> dict:
-        """Load fonts for rendering, including CJK support."""
-        fonts = {}
-
-        # Font paths to try - prioritize CJK-capable fonts
-        font_paths = [
-            # CJK fonts (support Chinese, Japanese, Korean)
-            "/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc",
-            "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
-            "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
-            "/usr/share/fonts/truetype/droid/DroidSansFallbackFull.ttf",
-            "/usr/share/fonts/truetype/wqy/wqy-zenhei.ttc",
-            "/usr/share/fonts/truetype/arphic/uming.ttc",
-            # Standard fonts (fallback)
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",  # macOS
-        ]
-
-        loaded_path = None
-        try:
-            for path in font_paths:
-                if Path(path).exists():
-                    fonts["header"] = ImageFont.truetype(path, 24)
-                    fonts["title"] = ImageFont.truetype(path, 20)
-                    fonts["normal"] = ImageFont.truetype(path, 16)
-                    fonts["small"] = ImageFont.truetype(path, 14)
-                    loaded_path = path
-                    logger.info(f"Loaded fonts from {path}")
-                    break
-        except Exception as e:
-            logger.warning(f"Could not load TrueType fonts: {e}, using default")
+        # Fonts are loaded once per process and shared across renderers
+        self.fonts = _get_fonts()
+
+        # Static background for the current layout, see _get_background
+        self._background: Optional[Image.Image] = None
+        self._background_key: Optional[tuple[int, int, int]] = None
+
+        # Canvas reused across renders of the same size; the lock serializes
+        # renders since they run in worker threads (see render)
+        self._canvas: Optional[Image.Image] = None
+        self._render_lock = threading.Lock()
 
-        # Fall back to default fonts
-        if not fonts:
-            default_font = ImageFont.load_default()
-            fonts["header"] = default_font
-            fonts["title"] = default_font
-            fonts["normal"] = default_font
-            fonts["small"] = default_font
+        # Most recently rendered dashboard as (filename without extension, PNG
+        # bytes), replaced as one object so readers never see a mismatched pair
+        self.latest: Optional[tuple[str, bytes]] = None
 
-        return fonts
+        # Inputs of the last render and its result, see _render_key
+        self._last_key: Optional[tuple] = None
+        self._last_result: Optional[tuple[str, str]] = None
 
-    def render(
+    async def render(
         self,
         goals: list[Goal],
         period_start: datetime,
@@ -87,7 +319,37 @@ class DashboardRenderer:
         weather: Optional[dict] = None,
     ) -> tuple[str, str]:
         """
-        Render the dashboard.
+        Render the dashboard in a worker thread.
+
+        Drawing and PNG encoding are blocking, so they are kept off the event
+        loop to let websocket traffic continue while a frame is produced.
+
+        Args:
+            goals: List of goals with progress calculated
+            period_start: Start of current 2-week period
+            period_end: End of current 2-week period
+            width: Image width
+            height: Image height
+            weather: Optional weather data dict with 'temperature', 'condition', etc.
+
+        Returns:
+            Tuple of (filename, file_path)
+        """
+        return await asyncio.to_thread(
+            self._render_sync, goals, period_start, period_end, width, height, weather
+        )
+
+    def _render_sync(
+        self,
+        goals: list[Goal],
+        period_start: datetime,
+        period_end: datetime,
+        width: int = 800,
+        height: int = 480,
+        weather: Optional[dict] = None,
+    ) -> tuple[str, str]:
+        """
+        Render the dashboard (blocking).
 
         Args:
             goals: List of goals with progress calculated
@@ -102,64 +364,159 @@ class DashboardRenderer:
         """
         logger.info(f"Rendering dashboard with {len(goals)} goals")
 
-        # Create image
-        image = Image.new("RGB", (width, height), "white")
-        draw = ImageDraw.Draw(image)
+        # The canvas and background cache are shared, so one render at a time
+        with self._render_lock:
+            # Nothing shown has changed since the last render: reuse its image
+            now = datetime.now()
+            key = self._render_key(goals, period_start, period_end, width, height, weather, now)
+            if key == self._last_key:
+                logger.info("Dashboard unchanged, reusing previous render")
+                return self._last_result
+
+            # Start from the static background, reusing the canvas between renders.
+            # The canvas is 1-bit: the background is already dithered and
+            # everything drawn on top is pure black or white.
+            background = self._get_background(width, height, len(goals))
+            if self._canvas is None or self._canvas.size != (width, height):
+                self._canvas = background.copy()
+            else:
+                self._canvas.paste(background)
+            image = self._canvas
 
-        # Calculate time position for the continuous line
-        now = datetime.now()
-        days_into_period = (now - period_start).days
-        day_fraction = (now.hour * 3600 + now.minute * 60 + now.second) / 86400
-        time_fraction = (days_into_period + day_fraction) / 14
+            # Calculate time position for the continuous line
+            days_into_period = (now - period_start).days
+            day_fraction = (now.hour * 3600 + now.minute * 60 + now.second) / 86400
+            time_fraction = (days_into_period + day_fraction) / 14
+
+            # Draw sections
+            self._draw_header(image, period_start, period_end, width, now, weather)
+            self._draw_goals(image, goals, width, height, time_fraction)
+
+            # Draw continuous time indicator line (full height)
+            self._draw_time_indicator(image, time_fraction, width, height)
+
+            # Save, naming the file after its contents so an identical image
+            # reuses the existing file (and its URL)
+            data = _encode_png(image)
+            filename = f"dashboard-{hashlib.blake2b(data, digest_size=8).hexdigest()}"
+            file_path = self.output_dir / f"{filename}.png"
+
+            # Keep the latest image in memory so it can be served without disk IO
+            self.latest = (filename, data)
+
+            if file_path.exists():
+                logger.info(f"Dashboard unchanged, reusing {file_path}")
+            else:
+                # Write to a temporary file and rename it into place, so the
+                # image is never served half-written
+                tmp_path = file_path.with_suffix(".png.tmp")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, file_path)
+                logger.info(f"Saved dashboard to {file_path}")
+
+            self._last_key = key
+            self._last_result = (filename, str(file_path))
+            return self._last_result
+
+    @staticmethod
+    def _render_key(
+        goals: list[Goal],
+        period_start: datetime,
+        period_end: datetime,
+        width: int,
+        height: int,
+        weather: Optional[dict],
+        now: datetime,
+    ) -> tuple:
+        """
+        Build a key of everything that affects the rendered image.
+
+        Time is included to the minute, so the "Updated" label and time
+        indicator still advance while counts are unchanged.
+        """
+        return (
+            tuple(
+                (
+                    goal.friendly_name,
+                    goal.config.emoji,
+                    goal.config.weekly_target,
+                    goal.config.hours_offset,
+                    goal.current_count,
+                )
+                for goal in goals
+            ),
+            period_start,
+            period_end,
+            width,
+            height,
+            tuple(weather.items()) if weather else None,
+            f"{now:%Y%m%d%H%M}",
+        )
+
+    def _text_width(self, text: str, font_key: str) -> int:
+        """Measure text width from its cached mask (no extra layout pass)."""
+        return _text_mask(text, font_key)[0].width
+
+    def _blit_text(self, image: Image, xy: tuple[int, int], text: str, font_key: str, fill=BLACK):
+        """Draw text by pasting its cached pre-rasterized mask (equivalent to draw.text())."""
+        mask, left, top = _text_mask(text, font_key)
+        image.paste(fill, (xy[0] + left, xy[1] + top), mask)
+
+    def _get_background(self, width: int, height: int, num_goals: int) -> Image:
+        """
+        Get the static parts of the dashboard, drawn once per layout.
+
+        Contains the midweek line, header divider and day ticks, which only
+        depend on the image size and number of goals. Drawn in grayscale and
+        dithered to monochrome once, so renders can work on a 1-bit canvas.
+        """
+        key = (width, height, num_goals)
+        if self._background is not None and self._background_key == key:
+            return self._background
+
+        background = Image.new("L", (width, height), WHITE)
+        draw = ImageDraw.Draw(background)
 
         # Draw midweek line FIRST (behind everything else)
         self._draw_midweek_line(draw, width, height)
 
-        # Draw sections
-        self._draw_header(draw, period_start, period_end, width, weather)
-        goals_area = self._draw_goals(draw, goals, width, height, time_fraction)
-
-        # Draw continuous time indicator line (full height)
-        self._draw_time_indicator(draw, time_fraction, width, height)
+        # Header divider line
+        draw.line((self.X_MARGIN, 52, width - self.X_MARGIN, 52), fill=BLACK, width=2)
 
         # Draw day ticks at bottom of goals area
+        goals_area = self._goals_area(width, height, num_goals)
         if goals_area:
-            self._draw_day_ticks(draw, goals_area, width)
-
-        # Convert to monochrome
-        image = self._convert_to_monochrome(image)
-
-        # Save
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        filename = f"dashboard-{timestamp}"
-        file_path = self.output_dir / f"{filename}.png"
+            self._draw_day_ticks(background, goals_area, width)
 
-        image.save(file_path, "PNG")
-        logger.info(f"Saved dashboard to {file_path}")
+        background = self._convert_to_monochrome(background)
 
-        return filename, str(file_path)
+        self._background = background
+        self._background_key = key
+        return background
 
     def _draw_header(
         self,
-        draw: ImageDraw,
+        image: Image,
         period_start: datetime,
         period_end: datetime,
         width: int,
+        now: datetime,
         weather: Optional[dict] = None,
     ):
-        """Draw header with 2-week period info, last update time, and optional weather."""
+        """Draw header with 2-week period info, last update time, and optional weather.
+
+        The divider line under the header is part of the static background.
+        """
         # Period range
-        period_text = f"{period_start.strftime('%b %d')} - {period_end.strftime('%b %d, %Y')}"
-        draw.text((self.X_MARGIN, 10), period_text, fill="black", font=self.fonts["title"])
+        period_text = _period_text(period_start.date(), period_end.date())
+        self._blit_text(image, (self.X_MARGIN, 10), period_text, "title")
 
         # Calculate day within 2-week period
-        now = datetime.now()
         days_into_period = (now - period_start).days
         day_of_period = min(days_into_period, 13)
-        day_names = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
-        day_name = day_names[(now.weekday() + 1) % 7]
+        day_name = DAY_NAMES[now.weekday()]
         day_text = f"Day {day_of_period + 1} of 14 ({day_name})"
-        draw.text((self.X_MARGIN, 32), day_text, fill="black", font=self.fonts["small"])
+        self._blit_text(image, (self.X_MARGIN, 32), day_text, "small")
 
         # Weather info (if available)
         if weather:
@@ -168,85 +525,73 @@ class DashboardRenderer:
                 condition = weather.get("condition", "")
                 weather_text = f"{temp}° {condition}" if temp else ""
                 if weather_text:
-                    bbox = draw.textbbox((0, 0), weather_text, font=self.fonts["small"])
-                    text_width = bbox[2] - bbox[0]
-                    draw.text((width - text_width - self.X_MARGIN, 10), weather_text, fill="black", font=self.fonts["small"])
+                    text_width = self._text_width(weather_text, "small")
+                    self._blit_text(image, (width - text_width - self.X_MARGIN, 10), weather_text, "small")
             except Exception as e:
                 logger.warning(f"Failed to render weather: {e}")
 
         # Last update time (right-aligned)
-        time_text = f"Updated: {now.strftime('%H:%M')}"
-        bbox = draw.textbbox((0, 0), time_text, font=self.fonts["small"])
-        text_width = bbox[2] - bbox[0]
-        draw.text((width - text_width - self.X_MARGIN, 32), time_text, fill="black", font=self.fonts["small"])
-
-        # Divider line
-        draw.line([self.X_MARGIN, 52, width - self.X_MARGIN, 52], fill="black", width=2)
+        time_text = f"Updated: {now:%H:%M}"
+        text_width = self._text_width(time_text, "small")
+        self._blit_text(image, (width - text_width - self.X_MARGIN, 32), time_text, "small")
 
     def _draw_goals(
         self,
-        draw: ImageDraw,
+        image: Image,
         goals: list[Goal],
         width: int,
         height: int,
         time_fraction: float,
-    ) -> Optional[dict]:
+    ):
+        """Draw all goals with progress bars, evenly distributed."""
+        if not goals:
+            return
+
+        available_height = height - self.HEADER_HEIGHT - self.BOTTOM_MARGIN
+        y_offsets = _row_offsets(self.HEADER_HEIGHT, available_height, len(goals))
+
+        for y_offset, goal in zip(y_offsets, goals):
+            self._draw_goal_row(image, goal, y_offset, width)
+
+    def _goals_area(self, width: int, height: int, num_goals: int) -> Optional[dict]:
         """
-        Draw all goals with progress bars, evenly distributed.
+        Get the goals area, from the first bar to the bottom of the last.
 
         Returns:
             Dict with goals area boundaries {top, bottom, left, right} or None if no goals
         """
-        if not goals:
+        if not num_goals:
             return None
 
         available_height = height - self.HEADER_HEIGHT - self.BOTTOM_MARGIN
-        num_goals = len(goals)
-        goal_spacing = available_height / num_goals
-
-        bar_positions = []  # Track bar positions for time indicator
-
-        for i, goal in enumerate(goals):
-            y_offset = self.HEADER_HEIGHT + int(i * goal_spacing)
-            bar_y = self._draw_goal_row(draw, goal, y_offset, width)
-            bar_positions.append(bar_y)
-
-        # Return goals area boundaries
-        if bar_positions:
-            return {
-                "top": bar_positions[0],
-                "bottom": bar_positions[-1] + self.BAR_HEIGHT,
-                "left": self.X_MARGIN,
-                "right": width - self.X_MARGIN,
-            }
-        return None
-
-    def _draw_goal_row(self, draw: ImageDraw, goal: Goal, y: int, width: int) -> int:
-        """
-        Draw a single goal with full-width progress bar.
-
-        Returns:
-            The y position of the progress bar
-        """
+        last_row_y = _row_offsets(self.HEADER_HEIGHT, available_height, num_goals)[-1]
+        return {
+            "top": self.HEADER_HEIGHT + self.BAR_OFFSET,
+            "bottom": last_row_y + self.BAR_OFFSET + self.BAR_HEIGHT,
+            "left": self.X_MARGIN,
+            "right": width - self.X_MARGIN,
+        }
+
+    def _draw_goal_row(self, image: Image, goal: Goal, y: int, width: int):
+        """Draw a single goal with full-width progress bar."""
         # Goal name with emoji
         if goal.config.emoji:
             name_text = f"{goal.config.emoji} {goal.friendly_name}"
         else:
             name_text = goal.friendly_name
 
-        draw.text((self.X_MARGIN, y), name_text, fill="black", font=self.fonts["normal"])
+        self._blit_text(image, (self.X_MARGIN, y), name_text, "normal")
 
         # Progress bar
-        bar_y = y + 22
         bar_width = width - (self.X_MARGIN * 2)
 
         # Double weekly_target for 2-week period display
         period_target = goal.config.weekly_target * 2
 
         self._draw_progress_bar(
-            draw,
+            image,
             x=self.X_MARGIN,
-            y=bar_y,
+            y=y + self.BAR_OFFSET,
             width=bar_width,
             height=self.BAR_HEIGHT,
             current=goal.current_count,
@@ -254,11 +599,9 @@ class DashboardRenderer:
             hours_offset=goal.config.hours_offset,
         )
 
-        return bar_y
-
     def _draw_progress_bar(
         self,
-        draw: ImageDraw,
+        image: Image,
         x: int,
         y: int,
         width: int,
@@ -291,38 +634,10 @@ class DashboardRenderer:
         # Total filled = offset + progress (but don't exceed bar width)
         total_filled_width = min(offset_width + progress_width, width)
 
-        # Draw filled portion (offset + progress combined)
-        if total_filled_width > 0:
-            draw.rectangle(
-                [x, y, x + total_filled_width, y + height],
-                fill="black",
-            )
-
-            # Draw gray/white dividers on filled segments so you can see increments
-            if is_integer_target:
-                int_target = int(target)
-                segment_width = width / int_target
-                for i in range(1, int_target):
-                    seg_x = x + int(i * segment_width)
-                    if seg_x < x + total_filled_width:
-                        # White line on filled portion
-                        draw.line([seg_x, y, seg_x, y + height], fill="white", width=2)
-
-        # Draw bar outline
-        draw.rectangle(
-            [x, y, x + width, y + height],
-            outline="black",
-            width=1,
-        )
-
-        # Draw segment dividers on unfilled portion
-        if is_integer_target:
-            int_target = int(target)
-            segment_width = width / int_target
-            for i in range(1, int_target):
-                seg_x = x + int(i * segment_width)
-                if seg_x >= x + total_filled_width:
-                    draw.line([seg_x, y, seg_x, y + height], fill="black", width=1)
+        # Paste the whole bar (fill, dividers and outline) in one go
+        segments = int(target) if is_integer_target else 0
+        bar, mask = _progress_bar(width, height, segments, total_filled_width)
+        image.paste(bar, (x, y), mask)
 
     def _draw_midweek_line(self, draw: ImageDraw, width: int, height: int):
         """Draw light gray midweek line from header divider to bottom (behind everything)."""
@@ -334,14 +649,14 @@ class DashboardRenderer:
 
         # Light gray, thick as weekend, from header line to bottom
         draw.line(
-            [midpoint_x, 52, midpoint_x, height],  # Start at header divider (y=52)
-            fill="#d0d0d0",  # Light gray
+            (midpoint_x, 52, midpoint_x, height),  # Start at header divider (y=52)
+            fill=LIGHT_GRAY,
             width=weekend_width,
         )
 
     def _draw_time_indicator(
         self,
-        draw: ImageDraw,
+        image: Image,
         time_fraction: float,
         width: int,
         height: int,
@@ -355,56 +670,38 @@ class DashboardRenderer:
         marker_top = 52  # Header divider line
         marker_bottom = height
 
-        # Dashed line pattern
-        dash_length = 4
-        gap_length = 3
-        current_y = marker_top
-        drawing = True
-        while current_y < marker_bottom:
-            if drawing:
-                end_y = min(current_y + dash_length, marker_bottom)
-                draw.line([marker_x, current_y, marker_x, end_y], fill="black", width=2)
-                current_y = end_y
-            else:
-                current_y += gap_length
-            drawing = not drawing
+        # Dashed line pattern, stamped in a single paste
+        mask = _dash_mask(marker_bottom - marker_top)
+        image.paste(BLACK, (marker_x - 2, marker_top), mask)
 
-    def _draw_day_ticks(self, draw: ImageDraw, goals_area: dict, width: int):
+    def _draw_day_ticks(self, image: Image, goals_area: dict, width: int):
         """Draw day ticks for all 14 days."""
         bar_width = goals_area["right"] - goals_area["left"]
         tick_y_top = goals_area["bottom"] + 3
-        tick_y_bottom = goals_area["bottom"] + 8
-
-        # Draw ticks for all 14 days (bolder)
-        for day in range(15):  # 0 through 14
-            tick_x = goals_area["left"] + int((day / 14) * bar_width)
-            tick_x = max(goals_area["left"], min(tick_x, goals_area["right"]))
-
-            # Weekend days (0, 6, 7, 8, 13, 14) get slightly longer ticks
-            is_weekend = day in [0, 6, 7, 8, 13, 14]
-            tick_bottom = tick_y_bottom + (2 if is_weekend else 0)
-            tick_width = 2
 
-            draw.line([tick_x, tick_y_top, tick_x, tick_bottom], fill="black", width=tick_width)
+        # All ticks are stamped from a single cached mask
+        mask = _day_ticks_mask(bar_width)
+        image.paste(BLACK, (goals_area["left"] - 2, tick_y_top), mask)
 
     def _convert_to_monochrome(self, image: Image) -> Image:
-        """Convert image to monochrome for e-ink display."""
-        return image.convert("1")
+        """
+        Convert image to monochrome for e-ink display.
+
+        Uses 8x8 Bayer ordered dithering so LIGHT_GRAY areas (the weekend band)
+        come out as an even stipple rather than being thresholded away. Unlike
+        Floyd-Steinberg there is no error carried between pixels, so this is a
+        plain per-pixel comparison against a cached threshold map.
+        """
+        threshold = _bayer_threshold(image.size)
+        return ImageChops.subtract(image, threshold).point(_NONZERO_LUT, "1")
 
 
-async def demo_render():
+async def demo_render(ha_url: Optional[str], ha_token: Optional[str]):
     """Demo: Render dashboard image."""
-    import os
-    from dotenv import load_dotenv
     from app.ha.client import HAClient
     from app.ha.discovery import GoalDiscovery
     from app.ha.history import ProgressCalculator
 
-    load_dotenv()
-
-    ha_url = os.getenv("HA_URL")
-    ha_token = os.getenv("HA_API_KEY")
-
     if not ha_url or not ha_token:
         print("Error: HA_URL and HA_API_KEY must be set in .env file")
         return
@@ -429,7 +726,7 @@ async def demo_render():
         # Render dashboard
         renderer = DashboardRenderer()
         period_start, period_end = calculator._get_current_period()
-        filename, file_path = renderer.render(goals, period_start, period_end)
+        filename, file_path = await renderer.render(goals, period_start, period_end)
 
         print("\n" + "=" * 60)
         print("DASHBOARD RENDERED")
@@ -445,6 +742,9 @@ async def demo_render():
 if __name__ == "__main__":
     import asyncio
     import logging
+    from dotenv import load_dotenv
 
+    # Read the environment once, when run as a script
+    load_dotenv()
     logging.basicConfig(level=logging.INFO)
-    asyncio.run(demo_render())
+    asyncio.run(demo_render(os.getenv("HA_URL"), os.getenv("HA_API_KEY")))
@@ -3,11 +3,19 @@
 import asyncio
 import json
 import logging
+import time
 from typing import Optional
 import websockets
 
 logger = logging.getLogger(__name__)
 
+# Keepalive pings so idle long-lived connections are not dropped (seconds)
+PING_INTERVAL = 20
+PING_TIMEOUT = 10
+
+# How long a get_states snapshot is reused before fetching it again (seconds)
+STATES_CACHE_TTL = 5.0
+
 
 class HAClient:
     """WebSocket client for Home Assistant API."""
@@ -26,6 +34,21 @@ class HAClient:
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
         self._message_id = 0
 
+        # Responses are read by a single task and handed to the waiting
+        # send_command call by message id, so commands can run concurrently
+        self._pending: dict[int, asyncio.Future] = {}
+        self._reader: Optional[asyncio.Task] = None
+        self._connect_lock = asyncio.Lock()
+
+        # Set by disconnect() so commands still in flight do not reconnect
+        self._closed = False
+
+        # Last get_states snapshot, indexed by entity_id (see get_states)
+        self._states: Optional[list[dict]] = None
+        self._states_by_id: dict[str, dict] = {}
+        self._states_fetched_at = 0.0
+        self._states_lock = asyncio.Lock()
+
     def _convert_to_ws_url(self, http_url: str) -> str:
         """Convert HTTP URL to WebSocket URL."""
         ws_url = http_url.replace("http://", "ws://").replace("https://", "wss://")
@@ -35,9 +58,16 @@ class HAClient:
 
     async def connect(self):
         """Connect and authenticate to Home Assistant WebSocket API."""
+        self._closed = False
+        await self._open()
+
+    async def _open(self):
+        """Open and authenticate a new connection and start its reader."""
         logger.info(f"Connecting to {self.ws_url}")
 
-        self.websocket = await websockets.connect(self.ws_url)
+        self.websocket = await websockets.connect(
+            self.ws_url, ping_interval=PING_INTERVAL, ping_timeout=PING_TIMEOUT
+        )
 
         # Receive auth required message
         auth_required = json.loads(await self.websocket.recv())
@@ -58,19 +88,84 @@ class HAClient:
         if auth_result.get("type") != "auth_ok":
             raise Exception(f"Authentication failed: {auth_result}")
 
+        self._reader = asyncio.create_task(self._read_loop())
+
         logger.info("✓ Connected and authenticated to Home Assistant")
 
+    @property
+    def connected(self) -> bool:
+        """Whether the connection is open and its reader is running."""
+        return self.websocket is not None and self._reader is not None and not self._reader.done()
+
+    async def ensure_connected(self):
+        """
+        Connect if there is no open connection, otherwise reuse it.
+
+        Lets one client be kept for the lifetime of the service: a dropped
+        connection is re-established on the next command, unless the client
+        was disconnected.
+        """
+        if self.connected:
+            return
+
+        async with self._connect_lock:
+            if self.connected:
+                return
+            if self._closed:
+                raise Exception("Client is disconnected from Home Assistant")
+            if self.websocket:
+                logger.info("Connection to Home Assistant lost, reconnecting")
+                await self._close()
+            await self._open()
+
+            # disconnect() may have been called while connecting
+            if self._closed:
+                await self._close()
+                raise Exception("Client is disconnected from Home Assistant")
+
     async def disconnect(self):
-        """Disconnect from Home Assistant."""
+        """Disconnect from Home Assistant; commands no longer reconnect until connect()."""
+        self._closed = True
+        await self._close()
+
+    async def _close(self):
+        """Stop the reader and close the current connection."""
+        if self._reader:
+            self._reader.cancel()
+            self._reader = None
         if self.websocket:
             await self.websocket.close()
             self.websocket = None
             logger.info("Disconnected from Home Assistant")
 
+    async def _read_loop(self):
+        """Read messages and resolve the pending command with the matching id."""
+        # Reported to waiting commands if the reader is cancelled (disconnect)
+        error: Exception = websockets.ConnectionClosed(None, None)
+        try:
+            while True:
+                response = json.loads(await self.websocket.recv())
+                future = self._pending.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except Exception as e:
+            logger.warning(f"WebSocket reader stopped: {e}")
+            error = e
+        finally:
+            # Fail any commands still waiting for a response
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
     async def send_command(self, command_type: str, **kwargs) -> dict:
         """
         Send a command to Home Assistant and wait for response.
 
+        Several commands may be in flight at once; each waits only for the
+        response carrying its own id. Connects on demand, and if the
+        connection drops the command is retried once on a new connection.
+
         Args:
             command_type: Command type (e.g., "config/label_registry/list")
             **kwargs: Additional command parameters
@@ -78,27 +173,39 @@ class HAClient:
         Returns:
             Response data dictionary
         """
-        if not self.websocket:
-            raise Exception("Not connected to Home Assistant")
-
+        await self.ensure_connected()
+        try:
+            response = await self._send(command_type, kwargs)
+        except websockets.ConnectionClosed:
+            if self._closed:
+                raise
+            await self.ensure_connected()
+            response = await self._send(command_type, kwargs)
+
+        if not response.get("success"):
+            logger.error(f"Command failed: {response}")
+            raise Exception(f"Command failed: {response.get('error', 'Unknown error')}")
+
+        return response.get("result", {})
+
+    async def _send(self, command_type: str, kwargs: dict) -> dict:
+        """Send one command and wait for its raw response message."""
         self._message_id += 1
-        message = {"id": self._message_id, "type": command_type, **kwargs}
+        message_id = self._message_id
+        message = {"id": message_id, "type": command_type, **kwargs}
 
-        logger.debug(f"Sending command: {command_type} (id={self._message_id})")
-        await self.websocket.send(json.dumps(message))
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
 
-        # Wait for response with matching ID
-        while True:
-            response_text = await self.websocket.recv()
-            response = json.loads(response_text)
+        logger.debug(f"Sending command: {command_type} (id={message_id})")
+        try:
+            await self.websocket.send(json.dumps(message))
+            response = await future
+        finally:
+            self._pending.pop(message_id, None)
 
-            if response.get("id") == self._message_id:
-                if not response.get("success"):
-                    logger.error(f"Command failed: {response}")
-                    raise Exception(f"Command failed: {response.get('error', 'Unknown error')}")
-
-                logger.debug(f"Received response for id={self._message_id}")
-                return response.get("result", {})
+        logger.debug(f"Received response for id={message_id}")
+        return response
 
     async def get_labels(self) -> list[dict]:
         """
@@ -118,6 +225,30 @@ class HAClient:
         """
         return await self.send_command("config/entity_registry/list")
 
+    async def get_states(self) -> list[dict]:
+        """
+        Get current state of all entities.
+
+        The full state list can be large, so a snapshot is reused for
+        STATES_CACHE_TTL seconds across callers, and concurrent callers
+        share a single fetch.
+
+        Returns:
+            List of state dictionaries
+        """
+        async with self._states_lock:
+            if self._states is None or time.monotonic() - self._states_fetched_at > STATES_CACHE_TTL:
+                states = await self.send_command("get_states")
+                self._states = states
+                self._states_by_id = {state.get("entity_id"): state for state in states}
+                self._states_fetched_at = time.monotonic()
+            return self._states
+
+    def invalidate_states(self):
+        """Drop the cached get_states snapshot so the next call fetches it again."""
+        self._states = None
+        self._states_fetched_at = 0.0
+
     async def get_state(self, entity_id: str) -> dict:
         """
         Get current state of an entity.
@@ -128,22 +259,50 @@ class HAClient:
         Returns:
             State dictionary
         """
-        states = await self.send_command("get_states")
-        for state in states:
-            if state.get("entity_id") == entity_id:
-                return state
-        raise Exception(f"Entity not found: {entity_id}")
+        await self.get_states()
+        state = self._states_by_id.get(entity_id)
+        if state is None:
+            raise Exception(f"Entity not found: {entity_id}")
+        return state
+
+    async def get_states_for(self, entity_ids: list[str]) -> dict[str, dict]:
+        """
+        Get current state of the given entities.
+
+        Args:
+            entity_ids: Entity IDs to look up
+
+        Returns:
+            Dictionary mapping entity_id to state, for the entities that exist
+        """
+        await self.get_states()
+        states_by_id = self._states_by_id
+        return {
+            entity_id: states_by_id[entity_id]
+            for entity_id in entity_ids
+            if entity_id in states_by_id
+        }
 
     async def get_history(
-        self, entity_ids: list[str], start_time: str, end_time: str
+        self,
+        entity_ids: list[str],
+        start_time: str,
+        end_time: str,
+        minimal_response: bool = True,
+        no_attributes: bool = True,
     ) -> dict:
         """
         Query history for entities during a time period.
 
+        All entities are fetched in a single request, so pass every entity
+        needed rather than calling this once per entity.
+
         Args:
             entity_ids: List of entity IDs to query
             start_time: Start time in ISO format
             end_time: End time in ISO format
+            minimal_response: Only include state and last_changed after the first row
+            no_attributes: Leave out entity attributes (much smaller responses)
 
         Returns:
             Dictionary mapping entity_id to list of state changes
@@ -153,22 +312,14 @@ class HAClient:
             start_time=start_time,
             end_time=end_time,
             entity_ids=entity_ids,
-            minimal_response=False,
-            no_attributes=False,
+            minimal_response=minimal_response,
+            no_attributes=no_attributes,
         )
         return result
 
 
-async def test_connection():
+async def test_connection(ha_url: Optional[str], ha_token: Optional[str]):
     """Test HA connection."""
-    import os
-    from dotenv import load_dotenv
-
-    load_dotenv()
-
-    ha_url = os.getenv("HA_URL")
-    ha_token = os.getenv("HA_API_KEY")
-
     if not ha_url or not ha_token:
         print("Error: HA_URL and HA_API_KEY must be set in .env file")
         return
@@ -193,5 +344,10 @@ async def test_connection():
 
 
 if __name__ == "__main__":
+    import os
+    from dotenv import load_dotenv
+
+    # Read the environment once, when run as a script
+    load_dotenv()
     logging.basicConfig(level=logging.INFO)
-    asyncio.run(test_connection())
+    asyncio.run(test_connection(os.getenv("HA_URL"), os.getenv("HA_API_KEY")))
@@ -1,7 +1,10 @@
 """Goal discovery from Home Assistant labels and entities."""
 
+import asyncio
+import functools
 import json
 import logging
+import time
 from typing import Optional
 
 from .client import HAClient
@@ -9,13 +12,97 @@ from .models import Goal, GoalConfig
 
 logger = logging.getLogger(__name__)
 
+# Label name prefixes that mark a goal
+GOAL_LABEL_PREFIXES = ("goal_",)
+
+# How long label and entity registry listings are reused (seconds)
+REGISTRY_CACHE_TTL = 60.0
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_config(label_name: str, description: str) -> Optional[GoalConfig]:
+    """
+    Parse goal configuration from a label description.
+
+    Descriptions only change when goals are reconfigured, so results are
+    cached and repeated discoveries skip the JSON parsing. The returned
+    config is shared and must not be modified.
+
+    Args:
+        label_name: Label name, stored on the config and used in log messages
+        description: Label description holding the JSON config
+
+    Returns:
+        GoalConfig if valid, None if invalid
+    """
+    if not description:
+        logger.warning("Label %s has no description, skipping", label_name)
+        return None
+
+    try:
+        # Parse JSON from description
+        config_data = json.loads(description)
+
+        # Extract weekly_target (required) - supports int or float (e.g., 1.5 for "3 per 2 weeks")
+        weekly_target = config_data.get("weekly_target")
+        if weekly_target is None or not isinstance(weekly_target, (int, float)) or weekly_target <= 0:
+            logger.warning("Label %s missing valid weekly_target, skipping", label_name)
+            return None
+        weekly_target = float(weekly_target)  # Ensure it's a float
+
+        # Extract optional fields
+        emoji = config_data.get("emoji")
+        sound = config_data.get("sound")
+        hours_offset = config_data.get("hours_offset", 0.0)
+        if not isinstance(hours_offset, (int, float)):
+            hours_offset = 0.0
+        hours_offset = float(hours_offset)
+
+        return GoalConfig(
+            label_id=label_name,  # Store the name, not internal ID
+            weekly_target=weekly_target,
+            emoji=emoji,
+            sound=sound,
+            hours_offset=hours_offset,
+        )
+
+    except json.JSONDecodeError as e:
+        logger.warning("Label %s has invalid JSON in description: %s", label_name, e)
+        return None
+
 
 class GoalDiscovery:
     """Discovers and configures goals from HA labels and entities."""
 
-    def __init__(self, client: HAClient):
-        """Initialize with HA client."""
+    def __init__(self, client: HAClient, ttl: float = REGISTRY_CACHE_TTL):
+        """
+        Initialize with HA client.
+
+        Args:
+            client: Connected HA client
+            ttl: Seconds to reuse the label and entity registries before fetching again
+        """
         self.client = client
+        self.ttl = ttl
+
+        # Registry listings rarely change, so they are cached between discoveries
+        self._registry: Optional[tuple[list[dict], list[dict]]] = None
+        self._registry_fetched_at = 0.0
+        self._registry_lock = asyncio.Lock()
+
+    def invalidate(self):
+        """Drop the cached registries so the next discovery fetches them again."""
+        self._registry = None
+
+    async def _get_registry(self) -> tuple[list[dict], list[dict]]:
+        """Get (labels, entities) from the registries, cached for self.ttl seconds."""
+        async with self._registry_lock:
+            if self._registry is None or time.monotonic() - self._registry_fetched_at > self.ttl:
+                self._registry = tuple(
+                    await asyncio.gather(self.client.get_labels(), self.client.get_entities())
+                )
+                self._registry_fetched_at = time.monotonic()
+            return self._registry
 
     async def discover_goals(self) -> list[Goal]:
         """
@@ -28,19 +115,21 @@ class GoalDiscovery:
         """
         logger.info("Discovering goals from Home Assistant...")
 
-        # Get all labels
-        all_labels = await self.client.get_labels()
-        logger.debug(f"Found {len(all_labels)} total labels")
+        # Get all labels and entities
+        all_labels, all_entities = await self._get_registry()
+        logger.debug("Found %d total labels", len(all_labels))
 
         # Debug: print all labels
         for label in all_labels:
-            logger.debug(f"  Label: {label.get('label_id')} - {label.get('name')}")
+            logger.debug("  Label: %s - %s", label.get("label_id"), label.get("name"))
 
         # Filter for goal labels (check name field, not label_id)
         goal_labels = [
-            label for label in all_labels if label.get("name", "").startswith("goal_")
+            label
+            for label in all_labels
+            if (name := label.get("name")) and name.startswith(GOAL_LABEL_PREFIXES)
         ]
-        logger.info(f"Found {len(goal_labels)} goal labels")
+        logger.info("Found %d goal labels", len(goal_labels))
 
         # Parse goal configurations from labels
         goal_configs = {}
@@ -50,33 +139,35 @@ class GoalDiscovery:
                 # Use label_id as key (entities reference label_id, not name)
                 goal_configs[label["label_id"]] = config
 
-        logger.info(f"Parsed {len(goal_configs)} valid goal configurations")
+        logger.info("Parsed %d valid goal configurations", len(goal_configs))
 
-        # Get all entities
-        all_entities = await self.client.get_entities()
-        logger.debug(f"Found {len(all_entities)} entities in registry")
+        logger.debug("Found %d entities in registry", len(all_entities))
 
         # Find entities with goal labels
+        goal_label_ids = frozenset(goal_configs)
         goals = []
         for entity in all_entities:
-            entity_labels = entity.get("labels", [])
+            entity_labels = entity.get("labels")
+            if not entity_labels:
+                continue
+
+            # Only use the first goal label on the entity
+            label_id = next((label_id for label_id in entity_labels if label_id in goal_label_ids), None)
+            if label_id is None:
+                continue
+
+            # Found a goal entity!
             entity_id = entity.get("entity_id")
+            goal = Goal(
+                entity_id=entity_id,
+                friendly_name=self._get_friendly_name(entity),
+                label_id=label_id,
+                config=goal_configs[label_id],
+            )
+            goals.append(goal)
+            logger.info("  ✓ Discovered goal: %s (%s)", goal.friendly_name, entity_id)
 
-            # Check if entity has any goal label
-            for label_id in entity_labels:
-                if label_id in goal_configs:
-                    # Found a goal entity!
-                    goal = Goal(
-                        entity_id=entity_id,
-                        friendly_name=self._get_friendly_name(entity),
-                        label_id=label_id,
-                        config=goal_configs[label_id],
-                    )
-                    goals.append(goal)
-                    logger.info(f"  ✓ Discovered goal: {goal.friendly_name} ({entity_id})")
-                    break  # Only use first matching goal label
-
-        logger.info(f"Discovered {len(goals)} goals total")
+        logger.info("Discovered %d goals total", len(goals))
         return goals
 
     def _parse_label_config(self, label: dict) -> Optional[GoalConfig]:
@@ -90,43 +181,7 @@ class GoalDiscovery:
             GoalConfig if valid, None if invalid
         """
         label_id = label.get("label_id")
-        label_name = label.get("name", label_id)
-        description = label.get("description", "")
-
-        if not description:
-            logger.warning(f"Label {label_name} has no description, skipping")
-            return None
-
-        try:
-            # Parse JSON from description
-            config_data = json.loads(description)
-
-            # Extract weekly_target (required) - supports int or float (e.g., 1.5 for "3 per 2 weeks")
-            weekly_target = config_data.get("weekly_target")
-            if weekly_target is None or not isinstance(weekly_target, (int, float)) or weekly_target <= 0:
-                logger.warning(f"Label {label_name} missing valid weekly_target, skipping")
-                return None
-            weekly_target = float(weekly_target)  # Ensure it's a float
-
-            # Extract optional fields
-            emoji = config_data.get("emoji")
-            sound = config_data.get("sound")
-            hours_offset = config_data.get("hours_offset", 0.0)
-            if not isinstance(hours_offset, (int, float)):
-                hours_offset = 0.0
-            hours_offset = float(hours_offset)
-
-            return GoalConfig(
-                label_id=label_name,  # Store the name, not internal ID
-                weekly_target=weekly_target,
-                emoji=emoji,
-                sound=sound,
-                hours_offset=hours_offset,
-            )
-
-        except json.JSONDecodeError as e:
-            logger.warning(f"Label {label_name} has invalid JSON in description: {e}")
-            return None
+        return _parse_config(label.get("name", label_id), label.get("description", ""))
 
     def _get_friendly_name(self, entity: dict) -> str:
         """
@@ -138,13 +193,8 @@ class GoalDiscovery:
         Returns:
             Friendly name or entity ID if not available
         """
-        # Try entity's name field first
-        name = entity.get("name")
-        if name:
-            return name
-
-        # Try original_name
-        name = entity.get("original_name")
+        # Try entity's name field first, then original_name
+        name = entity.get("name") or entity.get("original_name")
         if name:
             return name
 
@@ -158,16 +208,8 @@ class GoalDiscovery:
         return entity_id
 
 
-async def demo_discovery():
+async def demo_discovery(ha_url: Optional[str], ha_token: Optional[str]):
     """Demo: Discover and print all goals."""
-    import os
-    from dotenv import load_dotenv
-
-    load_dotenv()
-
-    ha_url = os.getenv("HA_URL")
-    ha_token = os.getenv("HA_API_KEY")
-
     if not ha_url or not ha_token:
         print("Error: HA_URL and HA_API_KEY must be set in .env file")
         return
@@ -207,6 +249,10 @@ async def demo_discovery():
 
 if __name__ == "__main__":
     import asyncio
+    import os
+    from dotenv import load_dotenv
 
+    # Read the environment once, when run as a script
+    load_dotenv()
     logging.basicConfig(level=logging.DEBUG)
-    asyncio.run(demo_discovery())
+    asyncio.run(demo_discovery(os.getenv("HA_URL"), os.getenv("HA_API_KEY")))
@@ -1,5 +1,6 @@
 """History querying and progress calculation."""
 
+import functools
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
@@ -10,6 +11,31 @@ from .models import Goal
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _period_bounds(day_ordinal: int, anchor_ordinal: int, period_days: int) -> tuple[datetime, datetime]:
+    """
+    Get start and end of the period containing a day.
+
+    Args:
+        day_ordinal: Day to look up, as date.toordinal()
+        anchor_ordinal: First day of some period, as date.toordinal()
+        period_days: Period length in days
+
+    Returns:
+        Tuple of (period_start, period_end) as datetime objects
+    """
+    # Find which period we're in
+    periods_elapsed = (day_ordinal - anchor_ordinal) // period_days
+
+    # Period start is the beginning (midnight) of this period
+    period_start = datetime.fromordinal(anchor_ordinal + periods_elapsed * period_days)
+
+    # Period ends period_days later minus 1 second
+    period_end = period_start + timedelta(days=period_days, seconds=-1)
+
+    return period_start, period_end
+
+
 class ProgressCalculator:
     """Calculates goal progress from Home Assistant history."""
 
@@ -17,6 +43,9 @@ class ProgressCalculator:
     PERIOD_ANCHOR = datetime(2020, 1, 5, 0, 0, 0)
     PERIOD_DAYS = 14  # 2-week periods
 
+    # Anchor as a day number, so days since the anchor are an int subtraction
+    _ANCHOR_ORDINAL = PERIOD_ANCHOR.toordinal()
+
     def __init__(self, client: HAClient):
         """Initialize with HA client."""
         self.client = client
@@ -40,17 +69,23 @@ class ProgressCalculator:
         if not goals:
             return goals
 
-        logger.info(f"Calculating progress for {len(goals)} goals...")
+        logger.info("Calculating progress for %d goals...", len(goals))
+
+        # Same moment for the period and every goal
+        now = datetime.now()
 
         # Get current 2-week period boundaries
-        period_start, period_end = self._get_current_period()
-        logger.info(f"Current 2-week period: {period_start.date()} to {period_end.date()}")
+        period_start, period_end = self._get_current_period(now)
+        logger.info("Current 2-week period: %s to %s", period_start.date(), period_end.date())
+
+        day_of_period = self._get_day_of_period(now)
+        days_left = (self.PERIOD_DAYS - 1) - day_of_period
 
         # Get current states for all goal entities
-        states = await self.client.send_command("get_states")
+        state_map = await self.client.get_states_for([goal.entity_id for goal in goals])
 
-        # Create a mapping of entity_id to state
-        state_map = {state.get("entity_id"): state for state in states}
+        # Goals often share a target, so compute each target by now only once
+        targets_by_now: dict[tuple[float, float], float] = {}
 
         # Calculate progress for each goal
         for goal in goals:
@@ -58,10 +93,13 @@ class ProgressCalculator:
 
             # Get current counter value
             if state:
-                try:
-                    current_count = int(state.get("state", 0))
-                except (ValueError, TypeError):
-                    logger.warning(f"Invalid state for {goal.entity_id}: {state.get('state')}")
+                # Check the string first: "unknown"/"unavailable" are common
+                # (e.g. while HA starts) and should not cost an exception
+                raw_state = state.get("state", "0")
+                if isinstance(raw_state, str) and raw_state.removeprefix("-").isdecimal():
+                    current_count = int(raw_state)
+                else:
+                    logger.warning("Invalid state for %s: %s", goal.entity_id, raw_state)
                     current_count = 0
 
                 # Update friendly name from state attributes (in case it was renamed in HA)
@@ -70,22 +108,23 @@ class ProgressCalculator:
                 if friendly_name:
                     goal.friendly_name = friendly_name
             else:
-                logger.warning(f"State not found for {goal.entity_id}")
+                logger.warning("State not found for %s", goal.entity_id)
                 current_count = 0
 
             # Calculate expected progress (weekly_target * 2 for 2-week period)
-            day_of_period = self._get_day_of_period(datetime.now())
-            period_target = goal.config.weekly_target * 2  # Double for 2-week period
-            target_by_now = self._calculate_target_by_now(
-                period_target, day_of_period, goal.config.hours_offset
-            )
+            config = goal.config
+            period_target = config.weekly_target * 2  # Double for 2-week period
+            target_key = (period_target, config.hours_offset)
+            target_by_now = targets_by_now.get(target_key)
+            if target_by_now is None:
+                target_by_now = self._calculate_target_by_now(
+                    period_target, day_of_period, config.hours_offset, now
+                )
+                targets_by_now[target_key] = target_by_now
 
             # Determine status
             status = self._calculate_status(current_count, target_by_now)
 
-            # Calculate days left in 2-week period
-            days_left = (self.PERIOD_DAYS - 1) - day_of_period
-
             # Update goal object
             goal.current_count = current_count
             goal.target_by_now = target_by_now
@@ -93,38 +132,33 @@ class ProgressCalculator:
             goal.days_left = days_left
 
             logger.info(
-                f"  {goal.friendly_name}: {current_count}/{period_target} "
-                f"(target by now: {target_by_now:.1f}, status: {status})"
+                "  %s: %d/%s (target by now: %.1f, status: %s)",
+                goal.friendly_name,
+                current_count,
+                period_target,
+                target_by_now,
+                status,
             )
 
         return goals
 
-    def _get_current_period(self) -> tuple[datetime, datetime]:
+    def _get_current_period(self, now: Optional[datetime] = None) -> tuple[datetime, datetime]:
         """
         Get start and end of current 2-week period.
 
         Uses a fixed anchor date to ensure consistent 2-week boundaries.
 
+        Args:
+            now: Current time (defaults to datetime.now())
+
         Returns:
             Tuple of (period_start, period_end) as datetime objects
         """
-        now = datetime.now()
-
-        # Calculate days since anchor
-        days_since_anchor = (now - self.PERIOD_ANCHOR).days
-
-        # Find which 2-week period we're in
-        periods_elapsed = days_since_anchor // self.PERIOD_DAYS
-        day_in_period = days_since_anchor % self.PERIOD_DAYS
-
-        # Period start is the beginning of this 2-week period
-        period_start = self.PERIOD_ANCHOR + timedelta(days=periods_elapsed * self.PERIOD_DAYS)
-        period_start = period_start.replace(hour=0, minute=0, second=0, microsecond=0)
+        if now is None:
+            now = datetime.now()
 
-        # Period ends 14 days later minus 1 second
-        period_end = period_start + timedelta(days=self.PERIOD_DAYS, seconds=-1)
-
-        return period_start, period_end
+        # Boundaries only depend on the day, so they are cached per day
+        return _period_bounds(now.toordinal(), self._ANCHOR_ORDINAL, self.PERIOD_DAYS)
 
     def _get_day_of_period(self, dt: datetime) -> int:
         """
@@ -136,11 +170,15 @@ class ProgressCalculator:
         Returns:
             Day of period (0-13)
         """
-        days_since_anchor = (dt - self.PERIOD_ANCHOR).days
+        days_since_anchor = dt.toordinal() - self._ANCHOR_ORDINAL
         return days_since_anchor % self.PERIOD_DAYS
 
     def _calculate_target_by_now(
-        self, period_target: float, day_of_period: int, hours_offset: float = 0.0
+        self,
+        period_target: float,
+        day_of_period: int,
+        hours_offset: float = 0.0,
+        now: Optional[datetime] = None,
     ) -> float:
         """
         Calculate expected count by current time (moves smoothly throughout the day).
@@ -149,6 +187,7 @@ class ProgressCalculator:
             period_target: Goal for the 2-week period (e.g., 4, or 1.5)
             day_of_period: 0-13 (day within 2-week period)
             hours_offset: Grace period in hours (e.g., 18 means due at 6pm not midnight)
+            now: Current time (defaults to datetime.now())
 
         Returns:
             Expected count by current moment (fractional days elapsed)
@@ -162,15 +201,17 @@ class ProgressCalculator:
             days_elapsed = 7.5 - (18/24) = 6.75
             = 4 * (6.75/14) = 1.93
         """
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         # Calculate fraction of today that has passed (0.0 at midnight, 1.0 at end of day)
         day_fraction = (now.hour * 3600 + now.minute * 60 + now.second) / 86400
         # Total days elapsed including partial current day
         days_elapsed = day_of_period + day_fraction
 
-        # Apply hours offset (subtract grace period, but don't go below 0)
-        offset_days = hours_offset / 24.0
-        days_elapsed = max(0.0, days_elapsed - offset_days)
+        # Apply hours offset (subtract grace period, but don't go below 0).
+        # Most goals have no offset, and days_elapsed is never negative.
+        if hours_offset:
+            days_elapsed = max(0.0, days_elapsed - hours_offset / 24.0)
 
         return period_target * (days_elapsed / self.PERIOD_DAYS)
 
@@ -195,17 +236,10 @@ class ProgressCalculator:
         return "on_track"
 
 
-async def demo_progress():
+async def demo_progress(ha_url: Optional[str], ha_token: Optional[str]):
     """Demo: Calculate and display 2-week progress."""
-    import os
-    from dotenv import load_dotenv
     from .discovery import GoalDiscovery
 
-    load_dotenv()
-
-    ha_url = os.getenv("HA_URL")
-    ha_token = os.getenv("HA_API_KEY")
-
     if not ha_url or not ha_token:
         print("Error: HA_URL and HA_API_KEY must be set in .env file")
         return
@@ -257,6 +291,10 @@ async def demo_progress():
 
 if __name__ == "__main__":
     import asyncio
+    import os
+    from dotenv import load_dotenv
 
+    # Read the environment once, when run as a script
+    load_dotenv()
     logging.basicConfig(level=logging.INFO)
-    asyncio.run(demo_progress())
+    asyncio.run(demo_progress(os.getenv("HA_URL"), os.getenv("HA_API_KEY")))
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GoalConfig:
     """Configuration parsed from HA label."""
     label_id: str
@@ -14,7 +14,7 @@ class GoalConfig:
     hours_offset: float = 0.0  # Grace period in hours (e.g., 18 = due at 6pm instead of midnight)
 
 
-@dataclass
+@dataclass(slots=True)
 class Goal:
     """A habit/goal to track."""
     entity_id: str
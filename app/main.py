@@ -1,11 +1,15 @@
 """Main FastAPI application."""
 
+import asyncio
 import logging
-from datetime import datetime
+import re
+import time
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timezone
 from typing import Optional
 
-from fastapi import FastAPI, Header, Request
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from .config import settings
@@ -27,18 +31,160 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Hold one Home Assistant connection (and its caches) for the lifetime of the app."""
+    client = HAClient(settings.ha_url, settings.ha_api_key)
+    app.state.ha_client = client
+    app.state.discovery = GoalDiscovery(client)
+    app.state.calculator = ProgressCalculator(client)
+
+    app.state.status_updates = asyncio.Queue()
+    status_writer = asyncio.create_task(write_device_statuses(app.state.status_updates))
+
+    try:
+        await client.connect()
+    except Exception as e:
+        # Not fatal: the client connects on demand when a dashboard is rendered
+        logger.warning("Could not connect to Home Assistant at startup: %s", e)
+
+    yield
+
+    # Let the writer flush whatever is still queued
+    app.state.status_updates.put_nowait(None)
+    await status_writer
+    db.close()
+
+    # Stop background work (e.g. dashboard refreshes) before it can reconnect
+    for task in list(_background_tasks):
+        task.cancel()
+    await asyncio.gather(*_background_tasks, return_exceptions=True)
+
+    await client.disconnect()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="TRMNL Home Assistant Dashboard",
     description="Habit tracker dashboard for TRMNL e-ink displays",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Initialize components
 db = DeviceDatabase()
 renderer = DashboardRenderer()
 
-# Mount static files
+# Most recent dashboard as (day, rendered_at, (filename, file_path)), see get_dashboard
+_render_cache: Optional[tuple[date, float, tuple[str, str]]] = None
+_render_lock = asyncio.Lock()
+
+# How long device status updates are collected into one database write (seconds)
+STATUS_BATCH_WINDOW = 0.1
+
+# Fire-and-forget tasks, referenced until they finish
+_background_tasks: set[asyncio.Task] = set()
+
+
+def run_in_background(coro, description: str):
+    """
+    Run a coroutine without waiting for it, logging (not raising) failures.
+
+    Args:
+        coro: Coroutine to run
+        description: What the coroutine does, for the error log
+    """
+
+    async def run():
+        try:
+            await coro
+        except Exception as e:
+            logger.error("%s failed: %s", description, e)
+
+    task = asyncio.create_task(run())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def queue_status_update(
+    mac_address: str,
+    firmware_version: Optional[str] = None,
+    battery_voltage: Optional[float] = None,
+):
+    """
+    Record that a device was seen, without waiting for the database write.
+
+    Args:
+        mac_address: Device MAC address (unknown devices are ignored)
+        firmware_version: Reported firmware version
+        battery_voltage: Reported battery voltage
+    """
+    app.state.status_updates.put_nowait(
+        (mac_address, time.time(), firmware_version or None, battery_voltage or None)
+    )
+
+
+async def write_device_statuses(queue: asyncio.Queue):
+    """
+    Write queued device status updates to the database.
+
+    Updates arriving within STATUS_BATCH_WINDOW of each other are written
+    in one transaction. Stops after writing when None is queued.
+    """
+    while True:
+        batch = [await queue.get()]
+        await asyncio.sleep(STATUS_BATCH_WINDOW)
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+
+        updates = [update for update in batch if update is not None]
+        if updates:
+            try:
+                await asyncio.to_thread(db.update_device_statuses, updates)
+            except Exception as e:
+                logger.error("Writing %d device status updates failed: %s", len(updates), e)
+
+        if len(updates) < len(batch):
+            return
+
+
+# Rendered dashboards are named after a hash of their contents, so they never change
+HASHED_IMAGE_NAME = re.compile(r"dashboard-[0-9a-f]{16}")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@app.get("/static/images/{filename}.png", include_in_schema=False)
+async def dashboard_image(
+    filename: str,
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Serve a dashboard image.
+
+    The most recent render is served straight from memory; anything else
+    falls back to the file on disk. Content-hashed images are marked
+    immutable and answered with 304 Not Modified when the client has them.
+    """
+    latest = renderer.latest
+    png = latest[1] if latest and latest[0] == filename else None
+    file_path = renderer.output_dir / f"{filename}.png"
+    if png is None and not file_path.is_file():
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    headers = {}
+    if HASHED_IMAGE_NAME.fullmatch(filename):
+        etag = f'"{filename}"'
+        headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL, "ETag": etag}
+        if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=headers)
+
+    if png is not None:
+        return Response(content=png, media_type="image/png", headers=headers)
+    return FileResponse(file_path, headers=headers)
+
+
+# Mount static files (registered after the dashboard image route so it takes precedence)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 def get_base_url(request: Request) -> str:
@@ -54,7 +200,7 @@ async def get_weather(client: HAClient) -> Optional[dict]:
     Returns None if weather is not available or fails.
     """
     try:
-        states = await client.send_command("get_states")
+        states = await client.get_states()
 
         # Look for weather entities
         for state in states:
@@ -74,7 +220,7 @@ async def get_weather(client: HAClient) -> Optional[dict]:
         return None
 
     except Exception as e:
-        logger.warning(f"Failed to fetch weather from HA: {e}")
+        logger.warning("Failed to fetch weather from HA: %s", e)
         return None
 
 
@@ -87,36 +233,87 @@ async def render_dashboard() -> tuple[str, str]:
     """
     logger.info("Rendering dashboard with fresh data from HA...")
 
-    # Connect to HA and render dashboard
-    client = HAClient(settings.ha_url, settings.ha_api_key)
+    # Reuse the app's long-lived HA connection (reconnects on demand)
+    client = app.state.ha_client
+    calculator = app.state.calculator
 
-    try:
-        await client.connect()
+    # Discover goals
+    goals = await app.state.discovery.discover_goals()
 
-        # Discover goals
-        discovery = GoalDiscovery(client)
-        goals = await discovery.discover_goals()
+    if not goals:
+        logger.warning("No goals found in Home Assistant")
+        # TODO: Return a "no goals" image
+        return "no-goals", "static/images/no-goals.png"
 
-        if not goals:
-            logger.warning("No goals found in Home Assistant")
-            # TODO: Return a "no goals" image
-            return "no-goals", "static/images/no-goals.png"
+    # Calculate progress
+    goals = await calculator.calculate_progress(goals)
 
-        # Calculate progress
-        calculator = ProgressCalculator(client)
-        goals = await calculator.calculate_progress(goals)
+    # Try to get weather (optional, may fail)
+    weather = await get_weather(client)
 
-        # Try to get weather (optional, may fail)
-        weather = await get_weather(client)
+    # Render dashboard
+    period_start, period_end = calculator._get_current_period()
+    filename, file_path = await renderer.render(goals, period_start, period_end, weather=weather)
 
-        # Render dashboard
-        period_start, period_end = calculator._get_current_period()
-        filename, file_path = renderer.render(goals, period_start, period_end, weather=weather)
+    return filename, file_path
 
-        return filename, file_path
 
-    finally:
-        await client.disconnect()
+async def get_dashboard(force: bool = False) -> tuple[str, str]:
+    """
+    Get the current dashboard, rendering it only when the cached one is stale.
+
+    A render is reused for settings.cache_duration seconds within the same
+    day, so polls from several devices share one Home Assistant fetch. Concurrent callers wait for a single
+    render instead of each starting their own.
+
+    Args:
+        force: Render even if the cached dashboard is still fresh
+
+    Returns:
+        Tuple of (filename, file_path)
+    """
+    global _render_cache
+
+    def cached() -> Optional[tuple[str, str]]:
+        if force or _render_cache is None:
+            return None
+        day, rendered_at, result = _render_cache
+        if day != date.today() or time.monotonic() - rendered_at >= settings.cache_duration:
+            return None
+        return result
+
+    result = cached()
+    if result:
+        return result
+
+    async with _render_lock:
+        # Another request may have rendered while we waited for the lock
+        result = cached()
+        if result:
+            return result
+
+        result = await render_dashboard()
+        _render_cache = (date.today(), time.monotonic(), result)
+        return result
+
+
+async def get_setup_dashboard() -> tuple[str, str]:
+    """
+    Get a dashboard for a device that is being provisioned.
+
+    Hands out the last render, even if it is stale, and refreshes it in the
+    background, so setup does not wait on Home Assistant. Only renders in
+    line if nothing has been rendered yet. The device fetches a fresh
+    dashboard on its first /api/display call anyway.
+
+    Returns:
+        Tuple of (filename, file_path)
+    """
+    if _render_cache is None:
+        return await get_dashboard()
+
+    run_in_background(get_dashboard(), "Background dashboard refresh")
+    return _render_cache[2]
 
 
 @app.get("/")
@@ -140,7 +337,7 @@ async def status():
     return {
         "status": "running",
         "version": "1.0.0",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
         "ha_url": settings.ha_url,
         "ha_connected": bool(settings.ha_api_key),
     }
@@ -158,26 +355,19 @@ async def display_endpoint(
 
     This is called by the TRMNL device to fetch the current dashboard.
     """
-    logger.info(f"Display request from device: {id}")
-
-    # Update device status
-    device = db.get_device(id)
-    if device:
-        db.update_device_status(
-            id,
-            last_seen=datetime.utcnow(),
-            firmware_version=fw_version,
-            battery_voltage=battery_voltage,
-        )
+    logger.info("Display request from device: %s", id)
+
+    # Update device status (a no-op for unknown devices)
+    queue_status_update(id, firmware_version=fw_version, battery_voltage=battery_voltage)
 
     # Render fresh dashboard
-    filename, file_path = await render_dashboard()
+    filename, file_path = await get_dashboard()
 
     # Build image URL
     base_url = get_base_url(request)
     image_url = f"{base_url}/static/images/{filename}.png"
 
-    logger.info(f"Serving dashboard: {filename}")
+    logger.info("Serving dashboard: %s", filename)
 
     return DisplayResponse(
         status=0,
@@ -203,16 +393,16 @@ async def setup_endpoint(
 
     Creates new device credentials or returns existing ones.
     """
-    logger.info(f"Setup request from device: {id}")
+    logger.info("Setup request from device: %s", id)
 
     # Check if device already exists
-    existing_device = db.get_device(id)
+    existing_device = await asyncio.to_thread(db.get_device, id)
     if existing_device:
-        logger.info(f"Device already exists: {existing_device.friendly_id}")
+        logger.info("Device already exists: %s", existing_device.friendly_id)
 
-        # Return existing credentials with fresh dashboard
+        # Return existing credentials with the current dashboard
         base_url = get_base_url(request)
-        filename, _ = await render_dashboard()
+        filename, _ = await get_setup_dashboard()
         image_url = f"{base_url}/static/images/{filename}.png"
 
         return SetupResponse(
@@ -231,23 +421,23 @@ async def setup_endpoint(
         mac_address=id,
         api_key=api_key,
         friendly_id=friendly_id,
-        created_at=datetime.utcnow(),
+        created_at=datetime.now(timezone.utc),
         firmware_version=fw_version,
     )
 
-    db.create_device(new_device)
+    new_device = await asyncio.to_thread(db.create_device, new_device)
 
-    # Return setup response with fresh dashboard
+    # Return setup response with the current dashboard
     base_url = get_base_url(request)
-    filename, _ = await render_dashboard()
+    filename, _ = await get_setup_dashboard()
     image_url = f"{base_url}/static/images/{filename}.png"
 
-    logger.info(f"Device provisioned: {friendly_id} ({id})")
+    logger.info("Device provisioned: %s (%s)", new_device.friendly_id, id)
 
     return SetupResponse(
         status=200,
         api_key=api_key,
-        friendly_id=friendly_id,
+        friendly_id=new_device.friendly_id,
         image_url=image_url,
         message="Welcome to your TRMNL HA Dashboard",
     )
@@ -263,12 +453,12 @@ async def log_endpoint(
 
     Receives logs from the device (battery, WiFi, etc.)
     """
-    logger.debug(f"Log from device {id}: {log_data.dict(exclude_none=True)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Log from device %s: %s", id, log_data.model_dump(exclude_none=True))
 
     # Update device status with telemetry
-    db.update_device_status(
+    queue_status_update(
         id,
-        last_seen=datetime.utcnow(),
         firmware_version=log_data.firmware_version,
         battery_voltage=log_data.battery_voltage,
     )
@@ -281,11 +471,14 @@ async def refresh_endpoint():
     """
     Render dashboard immediately (for testing).
 
-    Note: Cache is disabled, so every request gets fresh data anyway.
-    This endpoint is kept for backward compatibility.
+    Bypasses the dashboard cache and replaces its contents, and re-reads
+    the label and entity registries and entity states so new or edited
+    goals and counter changes show up.
     """
     logger.info("Manual refresh requested")
-    filename, file_path = await render_dashboard()
+    app.state.discovery.invalidate()
+    app.state.ha_client.invalidate_states()
+    filename, file_path = await get_dashboard(force=True)
 
     return {
         "status": "success",
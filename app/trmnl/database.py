@@ -4,7 +4,8 @@ import logging
 import secrets
 import sqlite3
 import string
-from datetime import datetime
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +13,12 @@ from .models import Device
 
 logger = logging.getLogger(__name__)
 
+# Schema version stored in PRAGMA user_version, see _migrate
+SCHEMA_VERSION = 1
+
+# Attempts at a unique friendly ID before giving up on creating a device
+FRIENDLY_ID_ATTEMPTS = 5
+
 
 class DeviceDatabase:
     """Simple SQLite database for TRMNL devices."""
@@ -20,112 +27,167 @@ class DeviceDatabase:
         """Initialize database."""
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection for the lifetime of the database, in autocommit mode
+        # (every statement here is a single read or write). It may be used
+        # from worker threads, so access is serialized with a lock.
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
         self._init_db()
 
     def _init_db(self):
-        """Create database tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+        """Configure the connection and create database tables if they don't exist."""
+        with self._lock:
+            # WAL avoids rewriting a rollback journal on every status update
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS devices (
                     mac_address TEXT PRIMARY KEY,
                     api_key TEXT NOT NULL,
                     friendly_id TEXT NOT NULL,
                     created_at TEXT NOT NULL,
-                    last_seen TEXT,
+                    last_seen TEXT,  -- legacy ISO timestamp, no longer written
                     firmware_version TEXT,
-                    battery_voltage REAL
+                    battery_voltage REAL,
+                    last_seen_ts REAL  -- Unix timestamp
                 )
             """)
-            conn.commit()
+            try:
+                self._conn.execute(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS idx_friendly_id ON devices(friendly_id)"
+                )
+            except sqlite3.IntegrityError:
+                logger.warning("Duplicate friendly IDs in database, not enforcing uniqueness")
+            self._migrate()
         logger.info(f"Database initialized at {self.db_path}")
 
+    def _migrate(self):
+        """Bring an existing database up to SCHEMA_VERSION (call with the lock held)."""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+
+        if version >= SCHEMA_VERSION:
+            return
+
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(devices)")}
+
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            if "last_seen_ts" not in columns:
+                # last_seen moves from an ISO string to a Unix timestamp in a REAL
+                # column (a TEXT column would store numbers as text)
+                self._conn.execute("ALTER TABLE devices ADD COLUMN last_seen_ts REAL")
+                self._conn.execute("""
+                    UPDATE devices
+                    SET last_seen_ts = (julianday(last_seen) - 2440587.5) * 86400.0
+                    WHERE last_seen IS NOT NULL
+                """)
+                logger.info(f"Migrated database to schema version {SCHEMA_VERSION}")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
     def get_device(self, mac_address: str) -> Optional[Device]:
         """Get device by MAC address."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
+        with self._lock:
+            row = self._conn.execute(
                 "SELECT * FROM devices WHERE mac_address = ?", (mac_address,)
-            )
-            row = cursor.fetchone()
-
-            if not row:
-                return None
-
-            return Device(
-                mac_address=row["mac_address"],
-                api_key=row["api_key"],
-                friendly_id=row["friendly_id"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-                last_seen=datetime.fromisoformat(row["last_seen"])
-                if row["last_seen"]
-                else None,
-                firmware_version=row["firmware_version"],
-                battery_voltage=row["battery_voltage"],
-            )
-
-    def create_device(self, device: Device):
-        """Create new device."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO devices (mac_address, api_key, friendly_id, created_at)
-                VALUES (?, ?, ?, ?)
-                """,
-                (
-                    device.mac_address,
-                    device.api_key,
-                    device.friendly_id,
-                    device.created_at.isoformat(),
-                ),
-            )
-            conn.commit()
+            ).fetchone()
+
+        if not row:
+            return None
+
+        return Device(
+            mac_address=row["mac_address"],
+            api_key=row["api_key"],
+            friendly_id=row["friendly_id"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            last_seen=datetime.fromtimestamp(row["last_seen_ts"], tz=timezone.utc)
+            if row["last_seen_ts"] is not None
+            else None,
+            firmware_version=row["firmware_version"],
+            battery_voltage=row["battery_voltage"],
+        )
+
+    def create_device(self, device: Device) -> Device:
+        """
+        Create new device.
+
+        If the friendly ID is already taken, a new one is generated.
+
+        Returns:
+            The device as stored (its friendly_id may differ from the one passed in)
+        """
+        for _ in range(FRIENDLY_ID_ATTEMPTS):
+            try:
+                with self._lock:
+                    self._conn.execute(
+                        """
+                        INSERT INTO devices (mac_address, api_key, friendly_id, created_at)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        (
+                            device.mac_address,
+                            device.api_key,
+                            device.friendly_id,
+                            device.created_at.isoformat(),
+                        ),
+                    )
+                break
+            except sqlite3.IntegrityError as e:
+                if "friendly_id" not in str(e):
+                    raise
+                logger.warning(f"Friendly ID {device.friendly_id} already taken, generating another")
+                device = device.model_copy(update={"friendly_id": generate_friendly_id()})
+        else:
+            raise Exception(f"Could not generate a unique friendly ID for {device.mac_address}")
+
         logger.info(f"Created device: {device.friendly_id} ({device.mac_address})")
+        return device
 
-    def update_device_status(
-        self,
-        mac_address: str,
-        last_seen: Optional[datetime] = None,
-        firmware_version: Optional[str] = None,
-        battery_voltage: Optional[float] = None,
+    def update_device_statuses(
+        self, updates: list[tuple[str, Optional[float], Optional[str], Optional[float]]]
     ):
-        """Update device status."""
-        updates = []
-        params = []
-
-        if last_seen:
-            updates.append("last_seen = ?")
-            params.append(last_seen.isoformat())
-
-        if firmware_version:
-            updates.append("firmware_version = ?")
-            params.append(firmware_version)
-
-        if battery_voltage:
-            updates.append("battery_voltage = ?")
-            params.append(battery_voltage)
-
-        if not updates:
-            return
-
-        params.append(mac_address)
+        """
+        Apply several device status updates in a single transaction.
+
+        Args:
+            updates: (mac_address, last_seen_ts, firmware_version, battery_voltage)
+                tuples, in the order they were reported; None leaves a field unchanged
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    """
+                    UPDATE devices SET
+                        last_seen_ts = COALESCE(?, last_seen_ts),
+                        firmware_version = COALESCE(?, firmware_version),
+                        battery_voltage = COALESCE(?, battery_voltage)
+                    WHERE mac_address = ?
+                    """,
+                    [(ts, fw, battery, mac) for mac, ts, fw, battery in updates],
+                )
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                f"UPDATE devices SET {', '.join(updates)} WHERE mac_address = ?",
-                params,
-            )
-            conn.commit()
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
 
 
 def generate_api_key() -> str:
-    """Generate secure API key."""
-    return "".join(
-        secrets.choice(string.ascii_letters + string.digits) for _ in range(32)
-    )
+    """Generate secure API key (32 URL-safe characters)."""
+    return secrets.token_urlsafe(24)
 
 
 def generate_friendly_id() -> str:
     """Generate short friendly device ID."""
-    return "".join(
-        secrets.choice(string.ascii_uppercase + string.digits) for _ in range(6)
-    )
+    return "".join(secrets.SystemRandom().choices(string.ascii_uppercase + string.digits, k=6))
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Shared Home Assistant WebSocket session for the test scripts."""
+
+import json
+from contextlib import asynccontextmanager
+import websockets
+
+
+def get_ws_url(ha_url):
+    """Convert a Home Assistant HTTP URL to its WebSocket API URL."""
+    ws_url = ha_url.replace("http://", "ws://").replace("https://", "wss://")
+    if not ws_url.endswith("/"):
+        ws_url += "/"
+    return ws_url + "api/websocket"
+
+
+@asynccontextmanager
+async def ha_session(ha_url, ha_token):
+    """
+    Connect and authenticate to Home Assistant, yielding the open websocket.
+
+    Several queries can be run inside one session to share the connection
+    and authentication.
+    """
+    ws_url = get_ws_url(ha_url)
+    print(f"Connecting to: {ws_url}\n")
+
+    # History and registry responses can exceed the default 1 MiB message limit
+    async with websockets.connect(ws_url, max_size=None) as websocket:
+        await websocket.recv()
+        await websocket.send(json.dumps({"type": "auth", "access_token": ha_token}))
+        auth_result = json.loads(await websocket.recv())
+
+        if auth_result.get("type") != "auth_ok":
+            raise Exception(f"Authentication failed: {auth_result}")
+
+        yield websocket
@@ -5,7 +5,8 @@ import asyncio
 import json
 import os
 from datetime import datetime, timedelta
-import websockets
+
+from ha_ws import ha_session
 
 
 async def test_raw_history():
@@ -14,17 +15,7 @@ async def test_raw_history():
     ha_url = os.getenv("HA_URL", "http://192.168.1.128:8123/")
     ha_token = os.getenv("HA_API_KEY")
 
-    ws_url = ha_url.replace("http://", "ws://").replace("https://", "wss://")
-    if not ws_url.endswith("/"):
-        ws_url += "/"
-    ws_url += "api/websocket"
-
-    async with websockets.connect(ws_url) as websocket:
-        # Auth
-        await websocket.recv()
-        await websocket.send(json.dumps({"type": "auth", "access_token": ha_token}))
-        await websocket.recv()
-
+    async with ha_session(ha_url, ha_token) as websocket:
         # Query history
         end_time = datetime.now()
         start_time = end_time - timedelta(days=1)
@@ -4,8 +4,10 @@
 import asyncio
 import json
 import os
+import sys
 from datetime import datetime, timedelta
-import websockets
+
+from ha_ws import ha_session
 
 
 async def test_history_websocket():
@@ -14,23 +16,7 @@ async def test_history_websocket():
     ha_url = os.getenv("HA_URL", "http://192.168.1.128:8123/")
     ha_token = os.getenv("HA_API_KEY")
 
-    ws_url = ha_url.replace("http://", "ws://").replace("https://", "wss://")
-    if not ws_url.endswith("/"):
-        ws_url += "/"
-    ws_url += "api/websocket"
-
-    print(f"Connecting to: {ws_url}\n")
-
-    async with websockets.connect(ws_url) as websocket:
-        # Auth
-        await websocket.recv()
-        await websocket.send(json.dumps({"type": "auth", "access_token": ha_token}))
-        auth_result = json.loads(await websocket.recv())
-
-        if auth_result.get("type") != "auth_ok":
-            print("Authentication failed!")
-            return
-
+    async with ha_session(ha_url, ha_token) as websocket:
         print("✓ Connected and authenticated\n")
 
         # Query history for last 7 days
@@ -43,8 +29,12 @@ async def test_history_websocket():
             "start_time": start_time.isoformat(),
             "end_time": end_time.isoformat(),
             "entity_ids": ["counter.test_counter"],
-            "minimal_response": False,
-            "no_attributes": False
+            # Only 's' and 'lu' are read below, so leave out attributes and
+            # the full state objects to keep the response small
+            "minimal_response": True,
+            "no_attributes": True,
+            # Only state changes matter for counting increments
+            "significant_changes_only": True
         }
 
         print(f"Querying history from {start_time.date()} to {end_time.date()}...\n")
@@ -67,7 +57,8 @@ async def test_history_websocket():
             timestamp_unix = state.get('lu')
             if timestamp_unix:
                 dt = datetime.fromtimestamp(timestamp_unix)
-                time_str = dt.strftime('%Y-%m-%d %H:%M:%S')
+                # Same text as strftime('%Y-%m-%d %H:%M:%S'), without the format parsing
+                time_str = dt.isoformat(sep=' ', timespec='seconds')
             else:
                 time_str = 'N/A'
             print(f"[{i+1}] State: {state.get('s')} at {time_str}")
@@ -87,51 +78,63 @@ async def test_history_websocket():
         print(f"Current week: {week_start.date()} to {week_end.date()}")
         print()
 
+        # Compare raw Unix timestamps; datetimes are only built for increments
+        week_start_ts = week_start.timestamp()
+        week_end_ts = week_end.timestamp()
+
         increments_this_week = []
-        prev_state = None
+        total_incremented = 0
+        prev_int = None
 
-        for state in entity_history:
-            # Parse timestamp - WebSocket uses 'lu' (last_updated) as Unix timestamp
-            timestamp_unix = state.get('lu') or state.get('lc')
-            if not timestamp_unix:
-                continue
+        # Increment reports are collected and written out in one go after the scan
+        out = []
 
-            # Convert Unix timestamp to datetime
-            timestamp = datetime.fromtimestamp(timestamp_unix)
+        for state in entity_history:
+            # WebSocket history always uses 'lu' (last_updated, Unix timestamp)
+            # and 's' (state), so the other spellings are only looked up if missing
+            try:
+                timestamp_unix = state['lu']
+            except KeyError:
+                timestamp_unix = state.get('lc')
+                if not timestamp_unix:
+                    continue
 
-            # Get state value - WebSocket uses 's' for state
-            state_value = state.get('s') or state.get('state')
+            try:
+                state_value = state['s']
+            except KeyError:
+                state_value = state.get('state')
 
+            # Each state is parsed once and carried over as the next one's previous value
             try:
                 current_int = int(state_value)
-
-                # Check if it's within current week
-                if week_start <= timestamp < week_end:
-                    if prev_state is not None:
-                        prev_int = int(prev_state)
-
-                        # Only count positive increments (ignore resets)
-                        if current_int > prev_int:
-                            increment = current_int - prev_int
-                            increments_this_week.append({
-                                'timestamp': timestamp,
-                                'from': prev_int,
-                                'to': current_int,
-                                'increment': increment
-                            })
-                            print(f"INCREMENT: {prev_int} → {current_int} (+{increment})")
-                            print(f"  Time: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-                            print()
-
-                prev_state = state_value
-
             except (ValueError, TypeError):
                 continue
 
+            # Check if it's within current week
+            if week_start_ts <= timestamp_unix < week_end_ts and prev_int is not None:
+                # Only count positive increments (ignore resets)
+                if current_int > prev_int:
+                    timestamp = datetime.fromtimestamp(timestamp_unix)
+                    increment = current_int - prev_int
+                    total_incremented += increment
+                    increments_this_week.append({
+                        'timestamp': timestamp,
+                        'from': prev_int,
+                        'to': current_int,
+                        'increment': increment
+                    })
+                    out.append(
+                        f"INCREMENT: {prev_int} → {current_int} (+{increment})\n"
+                        f"  Time: {timestamp.isoformat(sep=' ', timespec='seconds')}\n\n"
+                    )
+
+            prev_int = current_int
+
+        sys.stdout.write("".join(out))
+
         print(f"\n✓ Total increments this week: {len(increments_this_week)}")
 
         if increments_this_week:
-            total_incremented = sum(inc['increment'] for inc in increments_this_week)
             print(f"✓ Total count this week: {total_incremented}")
 
 
@@ -7,6 +7,22 @@ import os
 import websockets
 
 
+async def send_all(websocket, requests):
+    """Send several commands without waiting for their responses."""
+    for request in requests:
+        await websocket.send(json.dumps(request))
+
+
+async def collect(websocket, ids):
+    """Receive messages until there is a response for every id, keyed by id."""
+    responses = {}
+    while len(responses) < len(ids):
+        message = json.loads(await websocket.recv())
+        if message.get("id") in ids:
+            responses[message["id"]] = message
+    return responses
+
+
 async def test_ha_websocket():
     """Connect to HA WebSocket and query entity registry for labels."""
 
@@ -21,7 +37,8 @@ async def test_ha_websocket():
 
     print(f"Connecting to: {ws_url}")
 
-    async with websockets.connect(ws_url) as websocket:
+    # The entity registry can exceed the default 1 MiB message limit
+    async with websockets.connect(ws_url, max_size=None) as websocket:
         # 1. Receive auth required message
         auth_msg = await websocket.recv()
         print(f"\n1. Auth required:\n{auth_msg}\n")
@@ -45,17 +62,23 @@ async def test_ha_websocket():
 
         print("✓ Authentication successful!\n")
 
-        # 4. Request entity registry list
+        # 4. Request entity registry and label registry together, so both
+        # responses arrive in one round trip instead of two
         registry_request = {
             "id": 1,
             "type": "config/entity_registry/list"
         }
-        await websocket.send(json.dumps(registry_request))
-        print(f"4. Requesting entity registry...")
+        label_request = {
+            "id": 2,
+            "type": "config/label_registry/list"
+        }
+        await send_all(websocket, [registry_request, label_request])
+        print(f"4. Requesting entity registry and label registry...")
+
+        responses = await collect(websocket, {registry_request["id"], label_request["id"]})
 
-        # 5. Receive entity registry response
-        registry_response = await websocket.recv()
-        registry_data = json.loads(registry_response)
+        # 5. Entity registry response
+        registry_data = responses[registry_request["id"]]
 
         if not registry_data.get("success"):
             print(f"Registry request failed: {registry_data}")
@@ -64,8 +87,15 @@ async def test_ha_websocket():
         entities = registry_data.get("result", [])
         print(f"\n5. Received {len(entities)} entities\n")
 
-        # 6. Find entities with labels
-        entities_with_labels = [e for e in entities if e.get("labels")]
+        # 6. Find entities with labels, and counter.test_counter (step 7),
+        # in a single pass over the registry
+        entities_with_labels = []
+        test_counter = None
+        for e in entities:
+            if e.get("labels"):
+                entities_with_labels.append(e)
+            if test_counter is None and e.get("entity_id") == "counter.test_counter":
+                test_counter = e
 
         print(f"Found {len(entities_with_labels)} entities with labels:")
         for entity in entities_with_labels[:10]:  # Show first 10
@@ -74,8 +104,6 @@ async def test_ha_websocket():
             print(f"  Name: {entity.get('name', 'N/A')}")
 
         # 7. Look specifically for counter.test_counter
-        test_counter = next((e for e in entities if e.get("entity_id") == "counter.test_counter"), None)
-
         if test_counter:
             print(f"\n\n✓ Found counter.test_counter!")
             print(json.dumps(test_counter, indent=2))
@@ -83,16 +111,10 @@ async def test_ha_websocket():
             print(f"\n\n✗ counter.test_counter not found in entity registry")
             print("This might be because it's a simple helper not in the registry")
 
-        # 8. Request label registry to see all available labels
-        label_request = {
-            "id": 2,
-            "type": "config/label_registry/list"
-        }
-        await websocket.send(json.dumps(label_request))
-        print(f"\n\n6. Requesting label registry...")
+        # 8. Label registry response, to see all available labels
+        print(f"\n\n6. Label registry:")
 
-        label_response = await websocket.recv()
-        label_data = json.loads(label_response)
+        label_data = responses[label_request["id"]]
 
         if label_data.get("success"):
             labels = label_data.get("result", [])